@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 import argparse
 import csv
+import functools
 import io
 import json
+import os
 from pathlib import Path
 from collections import defaultdict
 from typing import Dict, List, Any, Optional, Tuple
@@ -24,9 +26,16 @@ def normalize_template(text: str) -> str:
     return "\n".join(out).rstrip() + "\n"
 
 
-def parse_text(template_path: Path, raw: str) -> List[Dict[str, Any]]:
+@functools.lru_cache(maxsize=256)
+def load_fsm(template_path: Path) -> textfsm.TextFSM:
+    # every host file for a command shares the same template; compile it once
     tpl = normalize_template(template_path.read_text(encoding="utf-8", errors="replace"))
-    fsm = textfsm.TextFSM(io.StringIO(tpl))
+    return textfsm.TextFSM(io.StringIO(tpl))
+
+
+def parse_text(template_path: Path, raw: str) -> List[Dict[str, Any]]:
+    fsm = load_fsm(template_path)
+    fsm.Reset()
     rows = fsm.ParseText(raw)
     headers = fsm.header
     return [{headers[i].lower(): r[i] for i in range(len(headers))} for r in rows]
@@ -34,34 +43,34 @@ def parse_text(template_path: Path, raw: str) -> List[Dict[str, Any]]:
 
 def write_csv(path: Path, rows: List[Dict[str, Any]]):
     cols: List[str] = []
+    seen = {"hostname"}
     for r in rows:
         for k in r:
-            if k != "hostname" and k not in cols:
+            if k not in seen:
+                seen.add(k)
                 cols.append(k)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=["hostname"] + cols)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
+    fieldnames = ["hostname"] + cols
+    with path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(fieldnames)
+        w.writerows([r.get(k, "") for k in fieldnames] for r in rows)
 
 
-def build_command_prefixes(platform_map: Dict[str, str]) -> List[Tuple[str, str]]:
+def build_command_prefixes(platform_map: Dict[str, str]) -> Dict[str, str]:
     """
     Convert mapping keys like "show cdp neighbors" to filename-friendly prefixes:
       "show_cdp_neighbors"
 
-    Return list of (cmd_prefix_underscored, mapping_key_original) sorted by longest first.
+    Return {cmd_prefix_underscored: mapping_key_original}; the first key wins on duplicates.
     """
-    items = []
+    prefix_to_key: Dict[str, str] = {}
     for k in platform_map.keys():
-        prefix = k.strip().lower().replace(" ", "_")
-        items.append((prefix, k))
-    items.sort(key=lambda x: len(x[0]), reverse=True)
-    return items
+        prefix_to_key.setdefault(k.strip().lower().replace(" ", "_"), k)
+    return prefix_to_key
 
 
-def split_command_and_hostname(filename_stem: str, cmd_prefixes: List[Tuple[str, str]]) -> Optional[Tuple[str, str, str]]:
+def split_command_and_hostname(filename_stem: str, cmd_prefixes: Dict[str, str]) -> Optional[Tuple[str, str, str]]:
     """
     Given stem like:
       show_cdp_neighbors_ciscol224_L2_1
@@ -70,11 +79,16 @@ def split_command_and_hostname(filename_stem: str, cmd_prefixes: List[Tuple[str,
     Return (cmd_part_underscored, hostname, mapping_key_original)
     """
     s = filename_stem.lower()
-    for cmd_prefix, orig_key in cmd_prefixes:
-        if s.startswith(cmd_prefix + "_"):
-            hostname = filename_stem[len(cmd_prefix) + 1:]  # keep original case for hostname
-            return cmd_prefix, hostname, orig_key
-    return None
+    cut = len(s)
+    # a prefix must end right before an "_": look those cut points up, longest first
+    while True:
+        cut = s.rfind("_", 0, cut)
+        if cut < 0:
+            return None
+        orig_key = cmd_prefixes.get(s[:cut])
+        if orig_key is not None:
+            hostname = filename_stem[cut + 1:]  # keep original case for hostname
+            return s[:cut], hostname, orig_key
 
 
 def resolve_template(platform_map: Dict[str, str], mapping_key_original: str) -> str:
@@ -98,9 +112,11 @@ def main():
         aliases = json.loads(cfg.read_text(encoding="utf-8")).get("platform_aliases", {})
 
     root = Path(args.root)
-    platform_dirs = [p for p in root.iterdir() if p.is_dir()]
     if args.platform:
         platform_dirs = [root / args.platform]
+    else:
+        with os.scandir(root) as it:
+            platform_dirs = [root / e.name for e in it if e.is_dir()]
 
     for platform_dir in sorted(platform_dirs):
         folder_platform = platform_dir.name
@@ -114,7 +130,13 @@ def main():
         cmd_prefixes = build_command_prefixes(platform_map)
         per_cmd = defaultdict(list)
 
-        for txt in sorted(platform_dir.glob("*.txt")):
+        try:
+            with os.scandir(platform_dir) as it:
+                txt_names = sorted(e.name for e in it if e.name.endswith(".txt") and e.is_file())
+        except (FileNotFoundError, NotADirectoryError):
+            txt_names = []
+
+        for txt in (platform_dir / n for n in txt_names):
             stem = txt.stem
             split = split_command_and_hostname(stem, cmd_prefixes)
             if not split:
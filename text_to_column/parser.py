@@ -1,16 +1,33 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import contextlib
 import csv
+import functools
+import hashlib
 import io
-import json
-from collections import defaultdict
+import itertools
+import mmap
+import os
+import re
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 import textfsm
 
+try:  # optional: orjson parses mapping/config JSON several times faster, straight from bytes
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# {cmd_prefix_underscored: mapping_key_original} from build_command_prefixes
+CommandPrefixes = Dict[str, str]
+
 
 @dataclass(frozen=True)
 class AutoDetectResult:
@@ -20,32 +37,185 @@ class AutoDetectResult:
     cols: int
 
 
+@dataclass(frozen=True)
+class PreparedTemplate:
+    """A platform/command already resolved to its template, for parsing many inputs."""
+
+    platform_folder: str
+    platform_resolved: str
+    command: str
+    template: str
+    template_path: Path
+    headers: Tuple[str, ...]  # lower-cased, in template order
+
+
+# Candidate "state" line (Start / SomeStateName) after a newline: not a Value line and not
+# starting with whitespace, '^' or '#'. The leading literal "\n" lets re skip ahead quickly.
+_STATE_LINE_CANDIDATE = re.compile(r"\n(?!Value )[^ \t^#\n]")
+
+
+def _is_state_line(text: str, start: int) -> bool:
+    end = text.find("\n", start)
+    line = text[start:] if end < 0 else text[start:end]
+    # blank / comment lines never open a state, even behind exotic whitespace
+    return not (line.startswith(("Value ", " ", "\t", "^")) or line.strip() == "" or line.lstrip().startswith("#"))
+
+
+@functools.lru_cache(maxsize=256)
 def normalize_template(text: str) -> str:
     """
     Some community TextFSM templates are formatted in ways that TextFSM is picky about.
     This normalizer keeps Value lines/comments/blank lines intact and indents '^' rules
     inside a state block so TextFSM can compile reliably.
 
+    Rules are indented from the first state line on, with one str.replace instead of a
+    per-line loop. Memoized on the template content, so repeated previews skip the work and
+    an edited template simply misses the cache.
+
     Kept from your original script, slightly clarified.
     """
-    lines = text.replace("\r\n", "\n").split("\n")
-    out: List[str] = []
-    in_state = False
-    for line in lines:
-        if line.startswith("Value ") or line.strip() == "" or line.lstrip().startswith("#"):
-            out.append(line)
-            continue
-        # A "state" line looks like: Start / SomeStateName
-        if not line.startswith((" ", "\t")) and not line.startswith("^"):
-            in_state = True
-            out.append(line)
-            continue
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+    # A "state" line looks like: Start / SomeStateName
+    start = 0 if _is_state_line(text, 0) else -1
+    if start < 0:
+        for m in _STATE_LINE_CANDIDATE.finditer(text):
+            if _is_state_line(text, m.start() + 1):
+                start = m.start() + 1
+                break
+    if start >= 0:
         # If we are inside a state, ensure regex rules are indented
-        if line.startswith("^") and in_state:
-            out.append("  " + line)
+        text = text[:start] + text[start:].replace("\n^", "\n  ^")
+    return text.rstrip() + "\n"
+
+
+@functools.lru_cache(maxsize=256)
+def _load_template(template_path: str, mtime_ns: int) -> str:
+    """Read and normalize a template once per (path, mtime); edits on disk invalidate it."""
+    return normalize_template(Path(template_path).read_text(encoding="utf-8", errors="replace"))
+
+
+# Value options that do not change how a single-state template records rows
+_FAST_OPTIONS = frozenset({"Required", "Key"})
+
+# input lines (as str.splitlines() gives them) -> rows
+_FastParser = Callable[[Iterable[str]], List[List[Any]]]
+
+
+def _fast_parser(fsm: textfsm.TextFSM) -> Optional[_FastParser]:
+    """
+    Build a direct line matcher for simple single-state templates, or None if TextFSM must run.
+
+    Covers the common shape where "Start" is the only state, every rule is a plain match
+    (optionally "-> Record") or an Error rule, and Values carry no option besides
+    Required/Key. The matcher returns exactly the rows ParseText would (and raises the same
+    TextFSMError on an Error rule), without the per-rule method calls and per-value option
+    hooks. It takes an iterable of lines, so input can be streamed through it.
+    """
+    if set(fsm.states) != {"Start"} or not fsm.values:
+        return None
+    if any(set(v.OptionNames()) - _FAST_OPTIONS for v in fsm.values):
+        return None
+
+    index = {v.name: i for i, v in enumerate(fsm.values)}
+    required = [i for i, v in enumerate(fsm.values) if "Required" in v.OptionNames()]
+    # (match, [(group, value_index)], records, (message prefix, suffix) around the input line or None)
+    rules = []
+    for rule in fsm.states["Start"]:
+        regex = re.compile(rule.regex)
+        if rule.line_op == "Error" and not rule.record_op:
+            # same messages as TextFSM._Operations; the line is concatenated, not formatted in,
+            # so braces in the template's error text stay literal
+            if rule.new_state:
+                error = ("Error: %s. Rule Line: %s. Input Line: " % (rule.new_state, rule.line_num), ".")
+            else:
+                error = ("State Error raised. Rule Line: %s. Input Line: " % rule.line_num, "")
+            rules.append((regex.match, [], False, error))
             continue
-        out.append(line)
-    return "\n".join(out).rstrip() + "\n"
+        if rule.line_op not in ("", "Next") or rule.record_op not in ("", "Record"):
+            return None
+        if rule.new_state not in ("", "Start"):
+            return None
+        assigns = [(g, index[g]) for g in regex.groupindex if g in index]
+        rules.append((regex.match, assigns, rule.record_op == "Record", None))
+
+    n = len(index)
+
+    def parse(lines: Iterable[str]) -> List[List[Any]]:
+        result: List[List[Any]] = []
+        cur: List[Any] = [None] * n
+        for line in lines:
+            for match, assigns, records, error in rules:
+                m = match(line)
+                if m is None:
+                    continue
+                if error is not None:
+                    raise textfsm.TextFSMError(error[0] + line + error[1])
+                for g, i in assigns:
+                    cur[i] = m.group(g)
+                if records:
+                    # same checks as TextFSM's _AppendRecord; the record is cleared either way
+                    if cur.count(None) != n and all(cur[i] for i in required):
+                        result.append(["" if v is None else v for v in cur])
+                    cur = [None] * n
+                break
+        # implicit Record at EOF
+        if cur.count(None) != n and all(cur[i] for i in required):
+            result.append(["" if v is None else v for v in cur])
+        return result
+
+    return parse
+
+
+def _compile_fsm(template_path: str, mtime_ns: int) -> Tuple[textfsm.TextFSM, Optional[_FastParser]]:
+    fsm = textfsm.TextFSM(io.StringIO(_load_template(template_path, mtime_ns)))
+    return fsm, _fast_parser(fsm)
+
+
+# ParseText mutates the FSM, so compiled prototypes are kept per thread
+_fsm_local = threading.local()
+
+# default size of each thread's compiled-template cache
+_FSM_CACHE_SIZE = 256
+_fsm_cache_size = _FSM_CACHE_SIZE
+
+
+def reserve_fsm_cache(templates: int) -> None:
+    """
+    Size per-thread template caches to hold a warm-up set of `templates` compiled FSMs, with
+    the default room left over for everything else. Call before warming; it applies to the
+    calling thread and to threads that have not compiled anything yet, and never shrinks.
+    """
+    global _fsm_cache_size
+    size = templates + _FSM_CACHE_SIZE
+    if size > _fsm_cache_size:
+        _fsm_cache_size = size
+        # this thread's cache is rebuilt at the new size on next use
+        _fsm_local.__dict__.pop("compile_fsm", None)
+
+
+def _get_compiled(template_path: Path) -> Tuple[textfsm.TextFSM, Optional[_FastParser]]:
+    """
+    Compiled TextFSM (plus fast matcher, if any) for a template, built once per (thread, path,
+    mtime). Reset() the FSM after ParseText, so the cached FSM neither carries state into the
+    next parse nor keeps the last result alive; rebuilding is slower than a reset, and a
+    deepcopy slower still.
+    """
+    compile_fsm = getattr(_fsm_local, "compile_fsm", None)
+    if compile_fsm is None:
+        compile_fsm = _fsm_local.compile_fsm = functools.lru_cache(maxsize=_fsm_cache_size)(_compile_fsm)
+    return compile_fsm(str(template_path), template_path.stat().st_mtime_ns)
+
+
+def _parse_rows(template_path: Path, raw: str) -> Tuple[List[str], List[List[Any]]]:
+    """(headers, rows) from the fast matcher when the template allows it, else from TextFSM."""
+    fsm, fast = _get_compiled(template_path)
+    if fast is not None:
+        return fsm.header, fast(raw.splitlines())
+    try:
+        return fsm.header, fsm.ParseText(raw)
+    finally:
+        fsm.Reset()  # a fresh result list; the returned rows are not touched
 
 
 def parse_with_template(template_path: Path, raw: str) -> Dict[str, Any]:
@@ -58,53 +228,155 @@ def parse_with_template(template_path: Path, raw: str) -> Dict[str, Any]:
         "rows": [ {header_lower: value, ...}, ...]
       }
     """
-    tpl = normalize_template(template_path.read_text(encoding="utf-8", errors="replace"))
-    fsm = textfsm.TextFSM(io.StringIO(tpl))
-    parsed = fsm.ParseText(raw)
-    headers = list(fsm.header)
-    rows = [{headers[i].lower(): row[i] for i in range(len(headers))} for row in parsed]
+    return _rows_to_dicts(*_parse_rows(template_path, raw))
+
+
+def _rows_to_dicts(headers: List[str], parsed: List[List[Any]]) -> Dict[str, Any]:
+    headers = list(headers)
+    # lower + intern the keys once: every row dict shares the same key objects
+    keys = [sys.intern(h.lower()) for h in headers]
+    rows = [dict(zip(keys, row)) for row in parsed]
     return {"headers": headers, "rows": rows}
 
 
-def build_command_prefixes(platform_map: Dict[str, str]) -> List[Tuple[str, str]]:
+def parse_with_template_positional(template_path: Path, raw: str) -> Tuple[List[str], List[List[Any]]]:
+    """
+    Like parse_with_template, but keep TextFSM's positional rows instead of building a dict per row.
+
+    Returns (headers_lower, rows) where every row is a list aligned with headers_lower.
+    """
+    headers, rows = _parse_rows(template_path, raw)
+    return [h.lower() for h in headers], rows
+
+
+_STREAM_CHUNK = 1 << 16
+
+
+def _stream_lines(text_io: TextIO) -> Iterator[str]:
+    """
+    Lines of a text stream, split exactly as str.splitlines() would split its whole content.
+
+    Reads fixed-size chunks and splits up to the last "\n" of each, carrying the rest over,
+    so only one chunk of text is held at a time.
+    """
+    tail = ""
+    while True:
+        chunk = text_io.read(_STREAM_CHUNK)
+        if not chunk:
+            break
+        buf = tail + chunk
+        cut = buf.rfind("\n") + 1
+        if cut:
+            yield from buf[:cut].splitlines()
+            tail = buf[cut:]
+        else:
+            tail = buf
+    if tail:
+        yield from tail.splitlines()
+
+
+def _parse_rows_stream(template_path: Path, text_io: TextIO) -> Tuple[List[str], List[List[Any]]]:
+    """
+    Like _parse_rows, but reading the input from a text stream.
+
+    Only the fast matcher consumes it line by line; TextFSM parses whole texts, so for other
+    templates the stream is read in one go.
+    """
+    fsm, fast = _get_compiled(template_path)
+    if fast is not None:
+        return fsm.header, fast(_stream_lines(text_io))
+    return _parse_rows(template_path, text_io.read())
+
+
+def parse_with_template_stream(template_path: Path, text_io: TextIO) -> Dict[str, Any]:
+    """Like parse_with_template, but line by line from a text stream instead of one big str."""
+    return _rows_to_dicts(*_parse_rows_stream(template_path, text_io))
+
+
+def build_command_prefixes(platform_map: Dict[str, str]) -> CommandPrefixes:
     """
     Convert mapping keys like "show cdp neighbors" to filename-friendly prefixes:
       "show_cdp_neighbors"
 
-    Return list of (cmd_prefix_underscored, mapping_key_original) sorted by longest first.
+    Return {cmd_prefix_underscored: mapping_key_original}; the first mapping key wins when
+    two keys give the same prefix. Memoized on the mapping keys; treat the result as read-only.
     """
-    items: List[Tuple[str, str]] = []
-    for k in platform_map.keys():
-        prefix = k.strip().lower().replace(" ", "_")
-        items.append((prefix, k))
-    items.sort(key=lambda x: len(x[0]), reverse=True)
-    return items
+    return _command_prefixes(tuple(platform_map))
 
 
-def split_command_and_hostname(filename_stem: str, cmd_prefixes: List[Tuple[str, str]]) -> Optional[Tuple[str, str, str]]:
+@functools.lru_cache(maxsize=64)
+def _command_prefixes(keys: Tuple[str, ...]) -> CommandPrefixes:
+    prefix_to_key: Dict[str, str] = {}
+    for k in keys:
+        prefix_to_key.setdefault(k.strip().lower().replace(" ", "_"), k)
+    return prefix_to_key
+
+
+def split_command_and_hostname(
+    filename_stem: str,
+    cmd_prefixes: CommandPrefixes,
+    stem_lower: Optional[str] = None,
+) -> Optional[Tuple[str, str, str]]:
     """
     Given stem like:
       show_cdp_neighbors_ciscol224_L2_1
 
     Find the longest command prefix that matches at the start, followed by "_".
     Return (cmd_prefix_underscored, hostname, mapping_key_original)
+
+    A matching prefix must end right before an "_", so only those cut points are looked up,
+    right to left: one dict lookup per "_" in the stem, however many commands are mapped.
+
+    Callers that already hold filename_stem.lower() can pass it as stem_lower.
     """
-    s = filename_stem.lower()
-    for cmd_prefix, orig_key in cmd_prefixes:
-        if s.startswith(cmd_prefix + "_"):
-            hostname = filename_stem[len(cmd_prefix) + 1:]  # keep original case for hostname
-            return cmd_prefix, hostname, orig_key
-    return None
+    s = filename_stem.lower() if stem_lower is None else stem_lower
+    cut = len(s)
+    while True:
+        cut = s.rfind("_", 0, cut)
+        if cut < 0:
+            return None
+        orig_key = cmd_prefixes.get(s[:cut])
+        if orig_key is not None:
+            hostname = filename_stem[cut + 1:]  # keep original case for hostname
+            return s[:cut], hostname, orig_key
+
+
+@functools.lru_cache(maxsize=8)
+def _load_json(path: str, mtime_ns: int, size: int) -> Any:
+    return _json_loads(Path(path).read_bytes())
+
+
+def _load_json_cached(path: Path) -> Any:
+    """Parse a JSON file once per (path, mtime, size), so edits show up without a restart."""
+    st = path.stat()
+    return _load_json(str(path), st.st_mtime_ns, st.st_size)
 
 
 def load_mapping(mapping_path: Path) -> Dict[str, Dict[str, str]]:
-    return json.loads(mapping_path.read_text(encoding="utf-8"))
+    # cached and shared between callers: treat as read-only
+    return _load_json_cached(mapping_path)
 
 
 def load_platform_aliases(config_path: Path) -> Dict[str, str]:
     if not config_path.exists():
         return {}
-    return json.loads(config_path.read_text(encoding="utf-8")).get("platform_aliases", {})
+    return _load_json_cached(config_path).get("platform_aliases", {})
+
+
+def _subdir_names(root: Path) -> List[str]:
+    """Names of the sub-folders of root (one scandir pass, no stat per entry)."""
+    with os.scandir(root) as it:
+        return [e.name for e in it if e.is_dir()]
+
+
+def _txt_files(folder: Path) -> List[Path]:
+    """Sorted *.txt files in folder; empty if the folder does not exist."""
+    try:
+        with os.scandir(folder) as it:
+            names = [e.name for e in it if e.name.endswith(".txt") and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    return [folder / n for n in sorted(names)]
 
 
 def list_platforms(repo_root: Path, root_dir: str = "files") -> List[str]:
@@ -114,7 +386,7 @@ def list_platforms(repo_root: Path, root_dir: str = "files") -> List[str]:
     root = repo_root / root_dir
     if not root.exists():
         return []
-    return sorted([p.name for p in root.iterdir() if p.is_dir()])
+    return sorted(_subdir_names(root))
 
 
 def list_commands_for_platform(
@@ -147,6 +419,60 @@ def resolve_template_name(
     return platform_map[command]
 
 
+def prepare_template(
+    repo_root: Path,
+    platform: str,
+    command: str,
+    templates_dir: str = "templates",
+    mapping_file: str = "mapping.json",
+    config_file: str = "config.json",
+) -> PreparedTemplate:
+    """
+    Resolve a platform/command to its template once; raises the same errors parse_text would.
+
+    Pass the result to parse_prepared for every input parsed with the same command.
+    """
+    mapping = load_mapping(repo_root / mapping_file)
+    aliases = load_platform_aliases(repo_root / config_file)
+    resolved = aliases.get(platform, platform)
+
+    tpl_name = resolve_template_name(mapping, platform, command, aliases=aliases)
+    tpl_path = repo_root / templates_dir / tpl_name
+    if not tpl_path.exists():
+        raise FileNotFoundError(f"Template not found: {tpl_path}")
+
+    fsm, _ = _get_compiled(tpl_path)
+    return PreparedTemplate(
+        platform_folder=platform,
+        platform_resolved=resolved,
+        command=command,
+        template=tpl_name,
+        template_path=tpl_path,
+        headers=tuple(h.lower() for h in fsm.header),
+    )
+
+
+def parse_prepared(prepared: PreparedTemplate, raw_text: str) -> Dict[str, Any]:
+    """Parse raw CLI text with a prepared template; returns the same dict as parse_text."""
+    return _prepared_result(prepared, parse_with_template(prepared.template_path, raw_text))
+
+
+def parse_prepared_stream(prepared: PreparedTemplate, text_io: TextIO) -> Dict[str, Any]:
+    """Like parse_prepared, but reading the CLI output from a text stream."""
+    return _prepared_result(prepared, parse_with_template_stream(prepared.template_path, text_io))
+
+
+def _prepared_result(prepared: PreparedTemplate, parsed: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "platform_folder": prepared.platform_folder,
+        "platform_resolved": prepared.platform_resolved,
+        "command": prepared.command,
+        "template": prepared.template,
+        "headers": [h.lower() for h in parsed["headers"]],
+        "rows": parsed["rows"],
+    }
+
+
 def parse_text(
     repo_root: Path,
     platform: str,
@@ -169,24 +495,29 @@ def parse_text(
         "rows": [...]
       }
     """
-    mapping = load_mapping(repo_root / mapping_file)
-    aliases = load_platform_aliases(repo_root / config_file)
-    resolved = aliases.get(platform, platform)
+    prepared = prepare_template(
+        repo_root, platform, command, templates_dir=templates_dir, mapping_file=mapping_file, config_file=config_file
+    )
+    return parse_prepared(prepared, raw_text)
 
-    tpl_name = resolve_template_name(mapping, platform, command, aliases=aliases)
-    tpl_path = repo_root / templates_dir / tpl_name
-    if not tpl_path.exists():
-        raise FileNotFoundError(f"Template not found: {tpl_path}")
 
-    parsed = parse_with_template(tpl_path, raw_text)
-    return {
-        "platform_folder": platform,
-        "platform_resolved": resolved,
-        "command": command,
-        "template": tpl_name,
-        "headers": [h.lower() for h in parsed["headers"]],
-        "rows": parsed["rows"],
-    }
+def parse_text_stream(
+    repo_root: Path,
+    platform: str,
+    command: str,
+    text_io: TextIO,
+    templates_dir: str = "templates",
+    mapping_file: str = "mapping.json",
+    config_file: str = "config.json",
+) -> Dict[str, Any]:
+    """
+    Like parse_text, but reads the CLI output from a text stream (e.g. io.TextIOWrapper over
+    an upload); templates the fast matcher covers parse it without materializing a single str.
+    """
+    prepared = prepare_template(
+        repo_root, platform, command, templates_dir=templates_dir, mapping_file=mapping_file, config_file=config_file
+    )
+    return parse_prepared_stream(prepared, text_io)
 
 
 def get_template_preview(
@@ -210,6 +541,14 @@ def get_template_preview(
     return {"template": tpl_name, "normalized": normalize_template(raw_tpl), "raw": raw_tpl}
 
 
+# (template path, template mtime_ns, digest of the input) -> (rows, cols), None if the
+# template failed. Re-running auto-detect on the same paste (UI re-preview, then parse) is
+# then a set of dict hits instead of a full parse per template.
+_autodetect_trials: Dict[Tuple[str, int, bytes], Optional[Tuple[int, int]]] = {}
+_AUTODETECT_TRIALS_MAX = 4096
+_MISSING = object()
+
+
 def autodetect_command(
     repo_root: Path,
     platform: str,
@@ -224,6 +563,9 @@ def autodetect_command(
 
     Heuristic: choose the template that yields the most rows; tie-breaker is most columns.
     Only templates that compile and return at least 1 row are considered.
+
+    Per-template outcomes are memoized on the input's digest, so auto-detecting the same text
+    again only re-parses templates that changed on disk.
     """
     mapping = load_mapping(repo_root / mapping_file)
     aliases = load_platform_aliases(repo_root / config_file)
@@ -235,6 +577,7 @@ def autodetect_command(
 
     best: Optional[AutoDetectResult] = None
     tried = 0
+    text_key = hashlib.blake2b(raw_text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
 
     for command, tpl_name in platform_map.items():
         if tried >= max_templates:
@@ -242,16 +585,26 @@ def autodetect_command(
         tried += 1
 
         tpl_path = repo_root / templates_dir / tpl_name
-        if not tpl_path.exists():
-            continue
-
         try:
-            parsed = parse_with_template(tpl_path, raw_text)
-        except Exception:
+            mtime_ns = tpl_path.stat().st_mtime_ns
+        except OSError:
             continue
 
-        rows_n = len(parsed.get("rows", []))
-        cols_n = len(parsed.get("headers", []))
+        trial_key = (str(tpl_path), mtime_ns, text_key)
+        shape = _autodetect_trials.get(trial_key, _MISSING)
+        if shape is _MISSING:
+            try:
+                headers, rows = parse_with_template_positional(tpl_path, raw_text)
+                shape = (len(rows), len(headers))
+            except Exception:
+                shape = None
+            if len(_autodetect_trials) >= _AUTODETECT_TRIALS_MAX:
+                _autodetect_trials.clear()
+            _autodetect_trials[trial_key] = shape
+
+        if shape is None:
+            continue
+        rows_n, cols_n = shape
         if rows_n <= 0:
             continue
 
@@ -328,13 +681,85 @@ def infer_hostname_after_command(filename: str, command: str) -> str:
 
 def rows_to_csv(headers: List[str], rows: List[Dict[str, Any]]) -> str:
     out = io.StringIO()
-    writer = csv.DictWriter(out, fieldnames=headers)
-    writer.writeheader()
-    for r in rows:
-        writer.writerow(r)
+    writer = csv.writer(out)
+    writer.writerow(headers)
+    # one writerows call instead of a DictWriter.writerow (key check + lookup) per row
+    writer.writerows([r.get(h, "") for h in headers] for r in rows)
     return out.getvalue()
 
 
+# output CSVs are written through a 64 KiB buffer: few write syscalls, while one file per
+# command can be open at once
+_WRITE_BUFFER = 1 << 16
+
+
+_MMAP_MIN_SIZE = 1 << 17
+
+
+def _read_fast(path: Path) -> str:
+    """
+    Read a whole input file with one unbuffered read and decode it once.
+
+    Skips read_text's text-layer buffering and newline translation; TextFSM splits lines with
+    str.splitlines(), which already handles CRLF line endings. Large files are mmapped and
+    decoded straight from the mapping, without copying them into a bytes object first.
+    """
+    with open(path, "rb", buffering=0) as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return str(mm, "utf-8", "replace")
+        data = f.read()
+    return data.decode("utf-8", errors="replace")
+
+
+def _read_ahead(paths: List[Path], window: int = 32) -> Iterator[str]:
+    """
+    Yield the decoded contents of `paths` in order, keeping up to `window` reads in flight.
+
+    File reads release the GIL, so a thread pool overlaps read latency (NFS, spinning disks,
+    cold cache) with parsing in the calling thread.
+    """
+    with ThreadPoolExecutor(max_workers=window) as ex:
+        it = iter(paths)
+        pending = deque(ex.submit(_read_fast, p) for p in itertools.islice(it, window))
+        while pending:
+            raw = pending.popleft().result()
+            for p in itertools.islice(it, 1):
+                pending.append(ex.submit(_read_fast, p))
+            yield raw
+
+
+def _parse_raw(raw: str, template_path: Path) -> Optional[Tuple[List[str], List[List[Any]]]]:
+    """Parse already-read input into (headers_lower, rows), or None if the template fails on it."""
+    try:
+        return parse_with_template_positional(template_path, raw)
+    except Exception:
+        return None
+
+
+def _parse_one(txt_path: Path, template_path: Path) -> Optional[Tuple[List[str], List[List[Any]]]]:
+    """
+    Worker for parse_folder_to_csv: read and parse one input file into (headers_lower, rows).
+
+    Top-level so it can run in a process pool. Returns None if the template fails on the input.
+    """
+    return _parse_raw(_read_fast(txt_path), template_path)
+
+
+def _csv_columns(headers: List[str]) -> Tuple[List[str], List[int]]:
+    """
+    Map template headers to CSV columns for parse_folder_to_csv: (columns, row_indices).
+
+    Matches the former dict-based output: the file hostname replaces any template "hostname"
+    value and goes first, and a duplicated header keeps its first position but its last value.
+    """
+    last: Dict[str, int] = {}
+    for i, h in enumerate(headers):
+        if h != "hostname":
+            last[h] = i
+    return list(last), list(last.values())
+
+
 def parse_folder_to_csv(
     repo_root: Path,
     root_dir: str = "files",
@@ -343,6 +768,7 @@ def parse_folder_to_csv(
     config_file: str = "config.json",
     out_dir: str = "files",
     only_platform: str = "",
+    max_workers: Optional[int] = None,
 ) -> List[str]:
     """
     Backwards-compatible behavior for the original CLI script:
@@ -351,6 +777,9 @@ def parse_folder_to_csv(
     - choose templates by longest prefix match against mapping keys
     - write per-command CSV: <resolved_platform>_<command_prefix>.csv into <out_dir>/
 
+    Files are parsed in a process pool of `max_workers` (default: CPU count); pass 1 to parse
+    inline. Platforms with only a handful of files are always parsed inline.
+
     Returns list of output filenames written.
     """
     mapping = load_mapping(repo_root / mapping_file)
@@ -360,66 +789,95 @@ def parse_folder_to_csv(
     if not root.exists():
         raise FileNotFoundError(f"Root folder not found: {root}")
 
-    platform_dirs = [p for p in root.iterdir() if p.is_dir()]
     if only_platform:
         platform_dirs = [root / only_platform]
+    else:
+        platform_dirs = [root / name for name in _subdir_names(root)]
 
     written: List[str] = []
-
-    for platform_dir in sorted(platform_dirs):
-        folder_platform = platform_dir.name
-        resolved_platform = aliases.get(folder_platform, folder_platform)
-
-        platform_map: Dict[str, str] = mapping.get(resolved_platform, {})
-        if not platform_map:
-            # Keep behavior: skip silently-ish
-            continue
-
-        cmd_prefixes = build_command_prefixes(platform_map)
-        per_cmd = defaultdict(list)
-
-        for txt in sorted(platform_dir.glob("*.txt")):
-            stem = txt.stem
-            split = split_command_and_hostname(stem, cmd_prefixes)
-            if not split:
+    workers = max_workers or os.cpu_count() or 1
+    # created lazily and shared by all platforms, so small runs never pay for process startup
+    pool: Optional[ProcessPoolExecutor] = None
+
+    try:
+        for platform_dir in sorted(platform_dirs):
+            folder_platform = platform_dir.name
+            resolved_platform = aliases.get(folder_platform, folder_platform)
+
+            platform_map: Dict[str, str] = mapping.get(resolved_platform, {})
+            if not platform_map:
+                # Keep behavior: skip silently-ish
                 continue
 
-            cmd_part, hostname, mapping_key = split
-            tpl_name = platform_map[mapping_key]
-            tpl_path = repo_root / templates_dir / tpl_name
-            if not tpl_path.exists():
-                continue
-
-            raw = txt.read_text(encoding="utf-8", errors="replace")
-            try:
-                parsed = parse_with_template(tpl_path, raw)
-            except Exception:
-                continue
-
-            for r in parsed["rows"]:
-                r["hostname"] = hostname
-                per_cmd[cmd_part].append(r)
-
-        outp = repo_root / out_dir
-        outp.mkdir(parents=True, exist_ok=True)
-
-        for cmd_part, rows in sorted(per_cmd.items()):
-            # stable column order: hostname first, then others discovered
-            cols: List[str] = []
-            for r in rows:
-                for k in r:
-                    if k != "hostname" and k not in cols:
-                        cols.append(k)
-
-            out_name = f"{resolved_platform}_{cmd_part}.csv"
-            out_path = outp / out_name
-
-            with out_path.open("w", newline="", encoding="utf-8") as f:
-                w = csv.DictWriter(f, fieldnames=["hostname"] + cols)
-                w.writeheader()
-                for r in rows:
-                    w.writerow(r)
-
-            written.append(out_name)
+            cmd_prefixes = build_command_prefixes(platform_map)
+            # mapping key -> template path (None if missing), resolved once per platform
+            tpl_paths: Dict[str, Optional[Path]] = {}
+            # (txt_path, template_path, hostname, cmd_part)
+            tasks: List[Tuple[Path, Path, str, str]] = []
+
+            # (txt_path, stem, lowered stem), each computed once per file
+            entries = [(p, p.stem, p.stem.lower()) for p in _txt_files(platform_dir)]
+            for txt, stem, stem_lower in entries:
+                split = split_command_and_hostname(stem, cmd_prefixes, stem_lower)
+                if not split:
+                    continue
+
+                cmd_part, hostname, mapping_key = split
+                if mapping_key not in tpl_paths:
+                    tpl_path = repo_root / templates_dir / platform_map[mapping_key]
+                    tpl_paths[mapping_key] = tpl_path if tpl_path.exists() else None
+                tpl_path = tpl_paths[mapping_key]
+                if tpl_path is None:
+                    continue
+
+                tasks.append((txt, tpl_path, hostname, cmd_part))
+
+            txt_paths = [t[0] for t in tasks]
+            tpl_list = [t[1] for t in tasks]
+            if len(tasks) < 4:
+                results = map(_parse_one, txt_paths, tpl_list)
+            elif workers > 1:
+                if pool is None:
+                    pool = ProcessPoolExecutor(max_workers=workers)
+                chunksize = max(1, len(tasks) // (4 * workers))
+                results = pool.map(_parse_one, txt_paths, tpl_list, chunksize=chunksize)
+            else:
+                # single process: overlap file reads with parsing
+                results = map(_parse_raw, _read_ahead(txt_paths), tpl_list)
+
+            outp = repo_root / out_dir
+            outp.mkdir(parents=True, exist_ok=True)
+
+            # cmd_part -> (csv writer, row indices or None when rows map 1:1), opened on the
+            # first parsed rows; rows are written as soon as each file is parsed
+            sinks: Dict[str, Tuple[Any, Optional[List[int]]]] = {}
+            with contextlib.ExitStack() as open_files:
+                # results come back in task order, so rows keep the sorted-filename order
+                for (_, _, hostname, cmd_part), parsed in zip(tasks, results):
+                    if not parsed or not parsed[1]:
+                        continue
+                    headers, rows = parsed
+                    sink = sinks.get(cmd_part)
+                    if sink is None:
+                        # headers are fixed per template: hostname first, then the template's columns
+                        cols, idx = _csv_columns(headers)
+                        out_path = outp / f"{resolved_platform}_{cmd_part}.csv"
+                        f = open_files.enter_context(
+                            out_path.open("w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER)
+                        )
+                        w = csv.writer(f)
+                        w.writerow(["hostname"] + cols)
+                        sink = sinks[cmd_part] = (w, None if idx == list(range(len(headers))) else idx)
+
+                    w, idx = sink
+                    if idx is None:
+                        w.writerows([hostname, *row] for row in rows)
+                    else:
+                        w.writerows([hostname, *(row[i] for i in idx)] for row in rows)
+
+            written.extend(f"{resolved_platform}_{cmd_part}.csv" for cmd_part in sorted(sinks))
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     return written
@@ -0,0 +1,119 @@
+"""
+Self-check for the parser's fast path: python -m text_to_column.selfcheck
+
+parser._fast_parser re-implements TextFSM's line matching, record/Required handling, the
+implicit Record at EOF and Error messages for simple single-state templates. This compares it
+(and the line-streaming reader that feeds it) with textfsm.TextFSM.ParseText on a few inline
+templates and the bundled samples, so a textfsm upgrade that changes any of that shows up as
+a failure instead of as silently different CSV output. Exits non-zero on any mismatch.
+"""
+
+import io
+import random
+import sys
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+import textfsm
+
+from text_to_column import parser as P
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# inline templates the fast path must cover, with the input vocabulary to draw lines from
+CASES: List[Tuple[str, str, List[str]]] = [
+    (
+        "required + partial record at EOF",
+        """\
+Value Required NAME (\\S+)
+Value Key PORT (\\d+)
+Value STATE (up|down)
+
+Start
+  ^name ${NAME}
+  ^port ${PORT}
+  ^state ${STATE} -> Record
+""",
+        ["name a", "name b1", "port 80", "port 443", "state up", "state down", "", "noise", "port x"],
+    ),
+    (
+        "error rules with braces in the message",
+        """\
+Value IFACE (\\S+)
+Value IP (\\S+)
+
+Start
+  ^interface ${IFACE}
+  ^ ip ${IP} -> Record
+  ^bad -> Error "oops {0} {x} %s"
+  ^worse -> Error
+  ^. -> Next
+""",
+        ["interface Gi0/1", " ip 10.0.0.1", "interface {x}", " ip {}", "bad", "bad {x}", "worse", "  ", "other"],
+    ),
+]
+
+
+def _outcome(fn: Callable[[], Any]) -> Any:
+    try:
+        return fn()
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+
+
+def _compare(label: str, template_text: str, text: str) -> List[str]:
+    """Fast path (whole text and streamed) vs a fresh TextFSM; returns failure messages."""
+    fsm = textfsm.TextFSM(io.StringIO(template_text))
+    fast = P._fast_parser(fsm)
+    if fast is None:
+        return [f"{label}: template no longer qualifies for the fast path"]
+
+    want = _outcome(lambda: textfsm.TextFSM(io.StringIO(template_text)).ParseText(text))
+    got = _outcome(lambda: fast(text.splitlines()))
+    streamed = _outcome(lambda: fast(P._stream_lines(io.StringIO(text, newline=""))))
+    failures = []
+    if got != want:
+        failures.append(f"{label}: fast path {got!r} != ParseText {want!r} for input {text!r}")
+    if streamed != want:
+        failures.append(f"{label}: streamed {streamed!r} != ParseText {want!r} for input {text!r}")
+    return failures
+
+
+def main() -> int:
+    failures: List[str] = []
+    checked = 0
+    rnd = random.Random(0)
+    # small chunks, so lines are split across stream reads
+    P._STREAM_CHUNK = 7
+
+    for label, template_text, vocab in CASES:
+        for _ in range(500):
+            lines = [rnd.choice(vocab) for _ in range(rnd.randint(0, 12))]
+            text = rnd.choice(["\n", "\r\n"]).join(lines) + rnd.choice(["", "\n"])
+            failures += _compare(label, template_text, text)
+            checked += 1
+
+    mapping = P.load_mapping(REPO_ROOT / "mapping.json")
+    aliases = P.load_platform_aliases(REPO_ROOT / "config.json")
+    for platform in P._subdir_names(REPO_ROOT / "files"):
+        prefixes = P.build_command_prefixes(mapping.get(aliases.get(platform, platform), {}))
+        for txt in P._txt_files(REPO_ROOT / "files" / platform):
+            split = P.split_command_and_hostname(txt.stem, prefixes)
+            if split is None:
+                continue
+            command = split[2]
+            tpl_name = P.resolve_template_name(mapping, platform, command, aliases=aliases)
+            template_text = P.normalize_template((REPO_ROOT / "templates" / tpl_name).read_text(encoding="utf-8"))
+            if P._fast_parser(textfsm.TextFSM(io.StringIO(template_text))) is None:
+                continue
+            failures += _compare(f"{tpl_name} on {txt.name}", template_text, txt.read_text(encoding="utf-8"))
+            checked += 1
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    print(f"{checked} inputs checked, {len(failures)} mismatches")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
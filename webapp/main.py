@@ -1,12 +1,25 @@
+from contextlib import asynccontextmanager, suppress
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import AsyncIterator, Iterator, Optional
+import asyncio
+import csv
 import io
+import json
+import os
 import zipfile
 
+try:  # optional: orjson serializes API responses and summary files several times faster
+    import orjson
+except ImportError:
+    orjson = None
+
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form
-from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from starlette.concurrency import iterate_in_threadpool
 
 from text_to_column.parser import (
     load_mapping,
@@ -14,6 +27,10 @@ from text_to_column.parser import (
     list_platforms,
     list_commands_for_platform,
     parse_text,
+    prepare_template,
+    parse_prepared_stream,
+    PreparedTemplate,
+    reserve_fsm_cache,
     get_template_preview,
     autodetect_command,
     rows_to_csv,
@@ -23,7 +40,77 @@ from text_to_column.parser import (
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
-app = FastAPI(title="text-to-column Web UI")
+PARSE_WORKERS = os.cpu_count() or 1
+
+
+def _worker_init(repo_root: Path) -> None:
+    """
+    Parse-pool initializer: load the config and compile the templates of every platform under
+    files/ once per worker, so autodetect and batch parses reuse them instead of each worker
+    compiling on first use. The template cache is sized to keep the whole warm set.
+    """
+    try:
+        mapping = load_mapping(repo_root / "mapping.json")
+        aliases = load_platform_aliases(repo_root / "config.json")
+        platforms = list_platforms(repo_root)
+    except (OSError, ValueError):
+        return
+    warm = [(p, c) for p in platforms for c in list_commands_for_platform(mapping, p, aliases)]
+    reserve_fsm_cache(len(warm))
+    for platform, command in warm:
+        # a broken template must not take the pool down; it errors again when requested
+        with suppress(Exception):
+            prepare_template(repo_root, platform, command)
+
+
+def _worker_ready() -> None:
+    pass
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Parse mapping.json / config.json once up front. The loaders are memoized on the file's
+    # mtime (edits still show up without a restart), and parse workers forked from this
+    # process start with the warm cache.
+    with suppress(OSError, ValueError):
+        load_mapping(REPO_ROOT / "mapping.json")
+        load_platform_aliases(REPO_ROOT / "config.json")
+
+    app.state.index_html = (STATIC_DIR / "index.html").read_text(encoding="utf-8")
+
+    # TextFSM parsing is CPU-bound: batch files are parsed in worker processes, with at
+    # most PARSE_WORKERS jobs handed to the pool at a time
+    app.state.pool = ProcessPoolExecutor(
+        max_workers=PARSE_WORKERS, initializer=_worker_init, initargs=(REPO_ROOT,)
+    )
+    app.state.parse_slots = asyncio.Semaphore(PARSE_WORKERS)
+    # Workers start on the first submit; start them (and their warm-up) now rather than on
+    # the first user request.
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(loop.run_in_executor(app.state.pool, _worker_ready) for _ in range(PARSE_WORKERS)))
+    try:
+        yield
+    finally:
+        app.state.pool.shutdown(cancel_futures=True)
+
+
+class _ORJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+def _dumps_indented(obj) -> bytes:
+    """summary.json / outputs.json body: 2-space indented JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+app = FastAPI(
+    title="text-to-column Web UI",
+    lifespan=lifespan,
+    default_response_class=_ORJSONResponse if orjson is not None else JSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -40,7 +127,8 @@ app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
 @app.get("/", response_class=HTMLResponse)
 def index():
-    return (STATIC_DIR / "index.html").read_text(encoding="utf-8")
+    # read once at startup; let browsers reuse the page for a few minutes
+    return HTMLResponse(app.state.index_html, headers={"Cache-Control": "public, max-age=300"})
 
 
 @app.get("/api/platforms")
@@ -56,6 +144,14 @@ def api_commands(platform: str):
     return {"commands": list_commands_for_platform(mapping, platform, aliases=aliases)}
 
 
+def _csv_headers(headers) -> list[str]:
+    """Stable CSV header order: de-duplicated, hostname first if it exists, then the rest."""
+    ordered = dict.fromkeys(headers)
+    if "hostname" in ordered:
+        return ["hostname", *(h for h in ordered if h != "hostname")]
+    return list(ordered)
+
+
 class ParseRequest(BaseModel):
     platform: str
     command: str = ""
@@ -65,67 +161,286 @@ class ParseRequest(BaseModel):
 
 
 @app.post("/api/parse")
-def api_parse(req: ParseRequest):
+async def api_parse(req: ParseRequest):
     if len(req.text) > 2_000_000:
         raise HTTPException(status_code=413, detail="Input too large (max 2MB).")
 
+    # CSV output is built in the worker as well, keeping rows_to_csv off the event loop
+    worker = _parse_raw_csv if req.output.lower() == "csv" else _parse_raw_text
     try:
-        command = req.command
-        if req.autodetect:
-            best = autodetect_command(REPO_ROOT, platform=req.platform, raw_text=req.text)
-            command = best.command
-
-        if not command:
-            raise ValueError("command is required unless autodetect=true")
-
-        parsed = parse_text(
-            repo_root=REPO_ROOT,
-            platform=req.platform,
-            command=command,
-            raw_text=req.text,
-        )
+        return await _run_in_pool(worker, REPO_ROOT, req.platform, req.command, req.autodetect, req.text)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    if req.output.lower() == "csv":
-        # stable header order: hostname first if exists, then remaining
-        headers = list(dict.fromkeys(parsed["headers"]))  # de-dup preserving order
-        if "hostname" in headers:
-            headers.remove("hostname")
-            headers = ["hostname"] + headers
-        return {"csv": rows_to_csv(headers, parsed["rows"]), "headers": headers}
-
-    return parsed
-
 
 @app.get("/api/template_preview")
-def api_template_preview(platform: str, command: str):
+async def api_template_preview(platform: str, command: str):
     try:
-        return get_template_preview(REPO_ROOT, platform=platform, command=command)
+        # a (cached) file read, not CPU-bound: a thread is enough
+        return await asyncio.to_thread(get_template_preview, REPO_ROOT, platform=platform, command=command)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.post("/api/autodetect")
-def api_autodetect(req: ParseRequest):
+async def api_autodetect(req: ParseRequest):
     """Return the best-matching command/template + parsed output."""
     if len(req.text) > 2_000_000:
         raise HTTPException(status_code=413, detail="Input too large (max 2MB).")
 
     try:
-        best = autodetect_command(REPO_ROOT, platform=req.platform, raw_text=req.text)
-        parsed = parse_text(
-            repo_root=REPO_ROOT,
-            platform=req.platform,
-            command=best.command,
-            raw_text=req.text,
-        )
-        parsed["autodetect"] = {"command": best.command, "template": best.template, "rows": best.rows, "cols": best.cols}
-        return parsed
+        return await _run_in_pool(_autodetect_and_parse, REPO_ROOT, req.platform, req.text)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+def _prepare(platform: str, command: str) -> Optional[PreparedTemplate]:
+    """Resolve a fixed batch command to its template once, before the per-file loop.
+
+    Returns None if that fails, so each file reports the error as parse_text raises it.
+    """
+    if not command:
+        return None
+    try:
+        return prepare_template(REPO_ROOT, platform=platform, command=command)
+    except Exception:
+        return None
+
+
+# Worker functions: TextFSM parsing is CPU-bound, so these run in the process pool.
+
+
+def _parse_raw_text(repo_root: Path, platform: str, command: str, autodetect: bool, raw_text: str) -> dict:
+    use_cmd = command
+    if autodetect:
+        best = autodetect_command(repo_root, platform=platform, raw_text=raw_text)
+        use_cmd = best.command
+    if not use_cmd:
+        raise ValueError("command is required unless autodetect=true")
+
+    return parse_text(repo_root, platform=platform, command=use_cmd, raw_text=raw_text)
+
+
+def _parse_raw_csv(repo_root: Path, platform: str, command: str, autodetect: bool, raw_text: str) -> dict:
+    parsed = _parse_raw_text(repo_root, platform, command, autodetect, raw_text)
+    headers = _csv_headers(parsed["headers"])
+    return {"csv": rows_to_csv(headers, parsed["rows"]), "headers": headers}
+
+
+def _autodetect_and_parse(repo_root: Path, platform: str, raw_text: str) -> dict:
+    best = autodetect_command(repo_root, platform=platform, raw_text=raw_text)
+    parsed = parse_text(repo_root, platform=platform, command=best.command, raw_text=raw_text)
+    parsed["autodetect"] = {"command": best.command, "template": best.template, "rows": best.rows, "cols": best.cols}
+    return parsed
+
+
+def _parse_one(
+    repo_root: Path,
+    platform: str,
+    command: str,
+    autodetect: bool,
+    raw_bytes: bytes,
+    prepared: Optional[PreparedTemplate] = None,
+) -> dict:
+    """Parse one uploaded file (runs in a worker process)."""
+    if prepared is not None:
+        # simple templates decode and parse line by line, without a full copy of the upload as str
+        text_io = io.TextIOWrapper(io.BytesIO(raw_bytes), encoding="utf-8", errors="replace")
+        return parse_prepared_stream(prepared, text_io)
+
+    raw_text = raw_bytes.decode("utf-8", errors="replace")
+    return _parse_raw_text(repo_root, platform, command, autodetect, raw_text)
+
+
+async def _run_in_pool(fn, *args):
+    """Run fn(*args) in the worker pool, with at most PARSE_WORKERS jobs handed over at once."""
+    async with app.state.parse_slots:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(app.state.pool, fn, *args)
+
+
+async def _parse_upload(
+    up: UploadFile, platform: str, command: str, autodetect: bool, prepared: Optional[PreparedTemplate]
+):
+    # Starlette already knows the spooled size; reject before pulling the file into memory.
+    if (up.size or 0) > 2_000_000:
+        return None
+    # Take the pool slot before reading, so at most PARSE_WORKERS uploads are held in memory
+    # at once however many files the batch has. The read is capped in case the size is unknown.
+    async with app.state.parse_slots:
+        raw_bytes = await up.read(2_000_001)
+        if len(raw_bytes) > 2_000_000:
+            return None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            app.state.pool, _parse_one, REPO_ROOT, platform, command, autodetect, raw_bytes, prepared
+        )
+
+
+async def _parse_uploads(
+    files: list[UploadFile],
+    platform: str,
+    command: str,
+    autodetect: bool,
+    prepared: Optional[PreparedTemplate] = None,
+) -> list[tuple[UploadFile, object]]:
+    """Read and parse the uploads concurrently, each file read once it has a pool slot.
+
+    Returns (upload, result) pairs in upload order. result is the parse_text() dict, the
+    exception raised while parsing, or None if the file was too large.
+    """
+    results = await asyncio.gather(
+        *(_parse_upload(up, platform, command, autodetect, prepared) for up in files),
+        return_exceptions=True,
+    )
+    return list(zip(files, results))
+
+
+# zlib level for batch ZIPs. Level 1 deflates CSV about 4x faster than the default (6); the
+# archive comes out somewhat larger (roughly 5-30% depending on how repetitive the rows are).
+ZIP_COMPRESSLEVEL = 1
+
+
+class _ZipSink:
+    """Write-only sink for ZipFile; take() hands over the bytes written since the last call."""
+
+    def __init__(self):
+        self._buf = bytearray()
+
+    def write(self, data) -> int:
+        self._buf += data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data = bytes(self._buf)
+        self._buf.clear()
+        return data
+
+
+# rows written to a CSV entry between two yields of compressed bytes
+ZIP_CSV_ROWS_PER_CHUNK = 1024
+
+# a CSV entry: (headers, row dicts), written straight into the archive
+CsvTable = tuple[list[str], list[dict]]
+
+
+def _new_zip(sink: _ZipSink) -> zipfile.ZipFile:
+    return zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL)
+
+
+def _zip_entry(z: zipfile.ZipFile, sink: _ZipSink, name: str, data: str | bytes | CsvTable) -> Iterator[bytes]:
+    """Write one entry to z, yielding the compressed bytes as they come out of the sink.
+
+    CsvTable entries are formatted like rows_to_csv() directly into the zip member, without
+    building the CSV text first.
+    """
+    if isinstance(data, tuple):
+        headers, rows = data
+        with io.TextIOWrapper(z.open(name, "w"), encoding="utf-8", newline="") as out:
+            writer = csv.writer(out)
+            writer.writerow(headers)
+            for i in range(0, len(rows), ZIP_CSV_ROWS_PER_CHUNK):
+                chunk = rows[i : i + ZIP_CSV_ROWS_PER_CHUNK]
+                writer.writerows([r.get(h, "") for h in headers] for r in chunk)
+                yield sink.take()
+    else:
+        z.writestr(name, data)
+    yield sink.take()
+
+
+def _iter_zip(entries: list[tuple[str, str | bytes | CsvTable]]) -> Iterator[bytes]:
+    """Yield a ZIP archive of (name, data) entries piece by piece, as each entry is deflated.
+
+    The sink is not seekable, so ZipFile writes data descriptors after each entry instead of
+    patching headers in place; only a bounded piece of compressed output is held at a time.
+    StreamingResponse runs this sync iterator in its thread pool, off the event loop.
+    """
+    sink = _ZipSink()
+    with _new_zip(sink) as z:
+        for name, data in entries:
+            yield from _zip_entry(z, sink, name, data)
+    yield sink.take()  # central directory
+
+
+def _per_file_entry(
+    up: UploadFile, parsed: object, fixed_headers: Optional[list[str]]
+) -> tuple[dict, Optional[tuple[str, CsvTable]]]:
+    """Summary item and (name, CSV) zip entry for one per-file upload; no entry if it failed."""
+    if parsed is None:
+        return {"file": up.filename, "ok": False, "error": "Input too large (max 2MB per file)."}, None
+    if isinstance(parsed, Exception):
+        return {"file": up.filename, "ok": False, "error": str(parsed)}, None
+
+    try:
+        headers = fixed_headers if fixed_headers is not None else _csv_headers(parsed["headers"])
+
+        stem = Path(up.filename or "output").stem
+        out_name = f"{stem}.csv"
+        return {
+            "file": up.filename,
+            "ok": True,
+            "command": parsed.get("command"),
+            "template": parsed.get("template"),
+            "rows": len(parsed.get("rows", [])),
+            "out": out_name,
+        }, (out_name, (headers, parsed["rows"]))
+    except Exception as e:
+        return {"file": up.filename, "ok": False, "error": str(e)}, None
+
+
+async def _iter_per_file_zip(
+    files: list[UploadFile],
+    platform: str,
+    command: str,
+    autodetect: bool,
+    prepared: Optional[PreparedTemplate],
+) -> AsyncIterator[bytes]:
+    """Stream the per-file ZIP, adding each CSV as soon as its file is parsed.
+
+    Workers keep parsing the remaining files while finished ones are compressed and sent, so
+    CSVs appear in completion order; summary.json comes last and stays in upload order.
+    Uploads are read here, after the handler returned: this relies on FastAPI >= 0.118 keeping
+    form files open until the response is finished.
+    """
+    fixed_headers = _csv_headers(prepared.headers) if prepared is not None else None
+
+    async def parse(i: int, up: UploadFile) -> tuple[int, object]:
+        try:
+            return i, await _parse_upload(up, platform, command, autodetect, prepared)
+        except Exception as e:
+            return i, e
+
+    tasks = [asyncio.ensure_future(parse(i, up)) for i, up in enumerate(files)]
+    summary: list[Optional[dict]] = [None] * len(files)
+    sink = _ZipSink()
+    try:
+        with _new_zip(sink) as z:
+            for next_done in asyncio.as_completed(tasks):
+                i, parsed = await next_done
+                summary[i], entry = _per_file_entry(files[i], parsed, fixed_headers)
+                if entry is not None:
+                    # deflate in the thread pool, off the event loop. Close the entry writer
+                    # even if the client goes away mid-entry: ZipFile.close() refuses to run
+                    # while a member is still open for writing.
+                    entry_pieces = _zip_entry(z, sink, *entry)
+                    try:
+                        async for piece in iterate_in_threadpool(entry_pieces):
+                            yield piece
+                    finally:
+                        entry_pieces.close()
+
+            for piece in _zip_entry(z, sink, "summary.json", _dumps_indented(summary)):
+                yield piece
+        yield sink.take()  # central directory
+    finally:
+        # client went away: drop the parses that have not started yet
+        for t in tasks:
+            t.cancel()
+
+
 @app.post("/api/batch_parse")
 async def api_batch_parse(
     platform: str = Form(...),
@@ -147,106 +462,59 @@ async def api_batch_parse(
     if batch_mode not in {"per_file", "combined"}:
         raise HTTPException(status_code=400, detail="batch_mode must be 'per_file' or 'combined'")
 
+    # with a fixed command, resolve and compile its template once for the whole batch; that
+    # reads mapping/template files and compiles TextFSM, so keep it off the event loop
+    prepared = None if autodetect else await asyncio.to_thread(_prepare, platform, command)
+
     # -------------------------
     # Mode 1: per-file CSV
     # -------------------------
     if batch_mode == "per_file":
-        summary = []
-        zbuf = io.BytesIO()
-        with zipfile.ZipFile(zbuf, mode="w", compression=zipfile.ZIP_DEFLATED) as z:
-            for up in files:
-                raw_bytes = await up.read()
-                if len(raw_bytes) > 2_000_000:
-                    summary.append({"file": up.filename, "ok": False, "error": "Input too large (max 2MB per file)."})
-                    continue
-
-                raw_text = raw_bytes.decode("utf-8", errors="replace")
-
-                try:
-                    use_cmd = command
-                    if autodetect:
-                        best = autodetect_command(REPO_ROOT, platform=platform, raw_text=raw_text)
-                        use_cmd = best.command
-                    if not use_cmd:
-                        raise ValueError("command is required unless autodetect=true")
-
-                    parsed = parse_text(REPO_ROOT, platform=platform, command=use_cmd, raw_text=raw_text)
-
-                    # stable header order: hostname first if exists, then remaining
-                    headers = list(dict.fromkeys(parsed["headers"]))
-                    if "hostname" in headers:
-                        headers.remove("hostname")
-                        headers = ["hostname"] + headers
-
-                    csv_text = rows_to_csv(headers, parsed["rows"])
-
-                    stem = Path(up.filename or "output").stem
-                    out_name = f"{stem}.csv"
-                    z.writestr(out_name, csv_text)
-                    summary.append({
-                        "file": up.filename,
-                        "ok": True,
-                        "command": parsed.get("command"),
-                        "template": parsed.get("template"),
-                        "rows": len(parsed.get("rows", [])),
-                        "out": out_name,
-                    })
-                except Exception as e:
-                    summary.append({"file": up.filename, "ok": False, "error": str(e)})
-
-            z.writestr("summary.json", __import__("json").dumps(summary, indent=2))
-
-        zbuf.seek(0)
         headers = {"Content-Disposition": 'attachment; filename="per_file_csvs.zip"'}
-        return StreamingResponse(zbuf, media_type="application/zip", headers=headers)
+        return StreamingResponse(
+            _iter_per_file_zip(files, platform, command, autodetect, prepared),
+            media_type="application/zip",
+            headers=headers,
+        )
 
     # -------------------------
     # Mode 2: combined CSVs
     # -------------------------
 
-    # key -> {"headers": set[str], "rows": list[dict]}
+    # key -> {"headers": dict[str, None] (ordered set), "rows": list[dict]}
     combined: dict[tuple[str, str], dict] = {}
     summary = []
 
-    for up in files:
-        raw_bytes = await up.read()
-        if len(raw_bytes) > 2_000_000:
+    for up, parsed in await _parse_uploads(files, platform, command, autodetect, prepared):
+        if parsed is None:
             summary.append({"file": up.filename, "ok": False, "error": "Input too large (max 2MB per file)."})
             continue
-
-        raw_text = raw_bytes.decode("utf-8", errors="replace")
+        if isinstance(parsed, Exception):
+            summary.append({"file": up.filename, "ok": False, "error": str(parsed)})
+            continue
 
         try:
-            use_cmd = command
-            if autodetect:
-                best = autodetect_command(REPO_ROOT, platform=platform, raw_text=raw_text)
-                use_cmd = best.command
-            if not use_cmd:
-                raise ValueError("command is required unless autodetect=true")
-
-            parsed = parse_text(REPO_ROOT, platform=platform, command=use_cmd, raw_text=raw_text)
+            use_cmd = parsed["command"]
             # Combined mode hostname rule: longest text after command slug
             host = infer_hostname_after_command(up.filename or "unknown", use_cmd)
 
-            # Build rows with hostname injected
-            rows = []
-            for r in parsed.get("rows", []):
-                rr = dict(r)
-                rr["hostname"] = host
-                rows.append(rr)
+            # Inject hostname; rows are fresh from the worker and not shared, so patch them in place
+            rows = parsed.get("rows", [])
+            for r in rows:
+                r["hostname"] = host
 
             key = (parsed.get("platform_resolved", platform), parsed.get("template", "unknown.textfsm"))
 
             # Initialize group
             if key not in combined:
-                combined[key] = {"headers": set(), "rows": []}
+                combined[key] = {"headers": {}, "rows": []}
 
-            # Track headers (ensure hostname always included)
+            # Track headers in first-seen (template) order; hostname is put first when writing
+            headers_seen = combined[key]["headers"]
             for h in parsed.get("headers", []):
-                combined[key]["headers"].add(h)
-            combined[key]["headers"].add("hostname")
+                headers_seen.setdefault(h, None)
 
-            combined[key]["rows"].extend(rows)
+            combined[key]["rows"] += rows
 
             summary.append(
                 {
@@ -262,25 +530,22 @@ async def api_batch_parse(
             summary.append({"file": up.filename, "ok": False, "error": str(e)})
 
     # Write output zip
-    zbuf = io.BytesIO()
-    with zipfile.ZipFile(zbuf, mode="w", compression=zipfile.ZIP_DEFLATED) as z:
-        outputs = []
-        for (platform_resolved, template), payload in combined.items():
-            # stable header order: hostname first, then remaining sorted
-            headers = ["hostname"] + sorted([h for h in payload["headers"] if h != "hostname"])
-            csv_text = rows_to_csv(headers, payload["rows"])
-
-            out_name = template.replace(".textfsm", ".csv")
-            # If template doesn't end with .textfsm, still output a sensible name
-            if out_name == template:
-                out_name = f"{platform_resolved}_{template}.csv".replace("/", "_")
-
-            z.writestr(out_name, csv_text)
-            outputs.append({"template": template, "platform_resolved": platform_resolved, "out": out_name, "rows": len(payload["rows"])})
-
-        z.writestr("summary.json", __import__("json").dumps(summary, indent=2))
-        z.writestr("outputs.json", __import__("json").dumps(outputs, indent=2))
-
-    zbuf.seek(0)
+    entries = []
+    outputs = []
+    for (platform_resolved, template), payload in combined.items():
+        # stable header order: hostname first, then the rest in template order
+        headers = ["hostname"] + [h for h in payload["headers"] if h != "hostname"]
+
+        out_name = template.replace(".textfsm", ".csv")
+        # If template doesn't end with .textfsm, still output a sensible name
+        if out_name == template:
+            out_name = f"{platform_resolved}_{template}.csv".replace("/", "_")
+
+        entries.append((out_name, (headers, payload["rows"])))
+        outputs.append({"template": template, "platform_resolved": platform_resolved, "out": out_name, "rows": len(payload["rows"])})
+
+    entries.append(("summary.json", _dumps_indented(summary)))
+    entries.append(("outputs.json", _dumps_indented(outputs)))
+
     headers = {"Content-Disposition": 'attachment; filename="combined_csvs.zip"'}
-    return StreamingResponse(zbuf, media_type="application/zip", headers=headers)
+    return StreamingResponse(_iter_zip(entries), media_type="application/zip", headers=headers)